@@ -4,6 +4,14 @@ GitHub Reinvite Tool - Remove and reinvite a collaborator from/to a GitHub repos
 
 __version__ = "0.2.0"
 
-from .cli import main
+__all__ = ["main", "__version__"]
 
-__all__ = ["main", "__version__"]
\ No newline at end of file
+
+def __getattr__(name):
+    # Import the Click command only when asked for, so importing the package
+    # (as the console script does) stays cheap
+    if name == "main":
+        from ._command import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
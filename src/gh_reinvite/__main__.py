@@ -1,8 +1,23 @@
 """
-Allow running the package with `python -m gh_reinvite`.
+Entry point for the gh-reinvite script and `python -m gh_reinvite`.
 """
 
-from .cli import run
+import sys
+
+from . import __version__
+
+
+def run():
+    """Answer --version without importing the CLI module, then hand off to it."""
+    # The CLI pulls in asyncio, subprocess and orjson at import time
+    if sys.argv[1:] == ["--version"]:
+        print(f"gh-reinvite, version {__version__}")
+        sys.exit(0)
+    
+    from .cli import run as cli_run
+
+    cli_run()
+
 
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    run()
@@ -0,0 +1,44 @@
+"""
+Click command for GitHub Reinvite Tool.
+
+Kept out of cli so that module can be compiled with mypyc; Click cannot
+attach its parameters to compiled functions.
+"""
+
+import asyncio
+from typing import Tuple
+
+import click
+
+from . import __version__
+from .cli import PERMISSION_CHOICES, amain
+
+
+@click.command()
+@click.argument('repository')
+@click.argument('usernames', nargs=-1, required=True)
+@click.option('--delay', '-d', default=5, type=int, help='Maximum seconds to wait for the removal before reinviting (default: 5)')
+@click.option('--permission', '-p', default='push', 
+              type=click.Choice(PERMISSION_CHOICES, case_sensitive=False),
+              help='Permission level for reinvite (default: push)')
+@click.option('--yes', '-y', is_flag=True, help='Skip confirmation prompt')
+@click.option('--force', '-f', is_flag=True,
+              help='Remove and reinvite even when only the permission level changes')
+@click.option('--concurrency', '-j', default=8, type=click.IntRange(min=1),
+              help='Maximum GitHub API requests in flight at once (default: 8)')
+@click.version_option(version=__version__, prog_name='gh-reinvite')
+def main(repository: str, usernames: Tuple[str, ...], delay: int, permission: str, yes: bool, force: bool,
+         concurrency: int):
+    """
+    GitHub Reinvite Tool - Remove and reinvite collaborators from/to a GitHub repository.
+    
+    This tool automates the process of removing collaborators from a GitHub repository,
+    waiting for a specified delay, and then reinviting them with the specified permissions.
+    Collaborators whose permission level merely changes are updated in place unless
+    --force is given.
+    
+    REPOSITORY: GitHub repository in owner/name format
+    
+    USERNAMES: One or more GitHub usernames to remove and reinvite
+    """
+    asyncio.run(amain(repository, usernames, delay, permission, yes, concurrency, force))
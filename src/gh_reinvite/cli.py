@@ -2,60 +2,269 @@
 CLI interface for GitHub Reinvite Tool.
 """
 
+import asyncio
 import json
+import math
+import os
 import subprocess
 import sys
 import time
-from typing import Tuple
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
-import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Confirm
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads  # type: ignore[assignment]
 
-console = Console()
+if TYPE_CHECKING:
+    import httpx
+    from rich.console import Console
+    from rich.progress import Progress
+    from rich.text import Text
 
-VALID_PERMISSIONS = ["pull", "triage", "push", "maintain", "admin"]
+T = TypeVar("T")
 
+# Status glyphs; _mark parses each once and reuses the renderable
+OK = "[green]✓[/green]"
+FAIL = "[red]✗[/red]"
+WARN = "[yellow]⚠[/yellow]"
 
-def run_gh_command(args: list, check: bool = True) -> Tuple[int, str, str]:
+# Display order for --help; membership checks use the frozenset
+PERMISSION_CHOICES: Tuple[str, ...] = ("pull", "triage", "push", "maintain", "admin")
+VALID_PERMISSIONS: FrozenSet[str] = frozenset(PERMISSION_CHOICES)
+
+# Collaborator role names that differ from the permission name used to grant them
+ROLE_PERMISSIONS: Dict[str, str] = {"read": "pull", "write": "push"}
+
+GITHUB_API_URL = "https://api.github.com"
+
+# Seconds to wait for gh and for GitHub API responses
+GH_TIMEOUT = 30
+INVITATIONS_TIMEOUT = 60
+
+# Largest page size the invitations and collaborators endpoints accept
+INVITATIONS_PAGE_SIZE = 100
+COLLABORATORS_PAGE_SIZE = 100
+
+# Backoff bounds in seconds while polling for a removal to take effect
+POLL_INITIAL_INTERVAL = 0.05
+POLL_MAX_INTERVAL = 1.0
+
+# Repository ETags from earlier runs, revalidated with conditional requests
+ETAG_CACHE_TTL = 24 * 60 * 60
+
+
+class UserStatus(NamedTuple):
+    """Pre-flight state of a user on the repository."""
+
+    is_collaborator: bool
+    invitation_id: int
+    permission: Optional[str]
+
+
+_token: Optional[str] = None
+# Where _token came from, for messages: "GITHUB_TOKEN" or "the GitHub CLI"
+_token_source = ""
+# Why ``gh auth token`` failed, when it was for some reason other than being logged out
+_token_error = ""
+_client: Optional["httpx.AsyncClient"] = None
+
+# Pending invitation IDs fetched so far per repository, keyed by casefolded
+# invitee login, and the next page to request (0 once every page has been read)
+_invitations: Dict[str, Dict[str, int]] = {}
+_invitation_next_page: Dict[str, int] = {}
+# When each repository's cached invitations were last dropped (time.monotonic())
+_invitations_since: Dict[str, float] = {}
+_invitation_locks: Dict[str, asyncio.Lock] = {}
+
+# Direct collaborator permissions per repository, keyed by casefolded login;
+# fetched once by whichever pre-flight check needs them first
+_direct_permissions: Dict[str, "asyncio.Future[Optional[Dict[str, str]]]"] = {}
+
+# Caps how many API requests are in flight at once (--concurrency)
+_request_limit: Optional[asyncio.Semaphore] = None
+
+
+@lru_cache(maxsize=None)
+def _console() -> "Console":
+    """Return the shared Rich console, importing Rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+@lru_cache(maxsize=None)
+def _mark(markup: str) -> "Text":
+    """Return markup parsed into a Rich Text, parsing each string only once."""
+    from rich.text import Text
+
+    return Text.from_markup(markup)
+
+
+def run_gh_command(args: list, check: bool = True, timeout: float = GH_TIMEOUT) -> Tuple[int, str, str]:
     """
     Execute a GitHub CLI command and return the result.
     
     Args:
         args: List of command arguments
         check: Whether to raise on non-zero exit code
+        timeout: Seconds to wait before giving up on gh
         
     Returns:
-        Tuple of (return_code, stdout, stderr)
+        Tuple of (return_code, stdout, stderr), with output left unstripped
     """
     try:
         result = subprocess.run(
             ["gh"] + args,
             capture_output=True,
             text=True,
-            check=check
+            check=check,
+            timeout=timeout
         )
-        return result.returncode, result.stdout.strip(), result.stderr.strip()
+        return result.returncode, result.stdout, result.stderr
     except subprocess.CalledProcessError as e:
-        return e.returncode, e.stdout.strip() if e.stdout else "", e.stderr.strip() if e.stderr else ""
+        return e.returncode, e.stdout or "", e.stderr or ""
+    except subprocess.TimeoutExpired:
+        return 124, "", f"gh timed out after {timeout:g}s"
     except FileNotFoundError:
-        console.print("[bold red]Error:[/bold red] GitHub CLI (gh) is not installed.")
-        console.print("Please install it from: https://cli.github.com/")
+        _console().print("[bold red]Error:[/bold red] GitHub CLI (gh) is not installed.")
+        _console().print("Please install it from: https://cli.github.com/")
         sys.exit(1)
 
 
-def check_gh_auth():
-    """Check if GitHub CLI is authenticated."""
-    returncode, _, _ = run_gh_command(["auth", "status"], check=False)
-    if returncode != 0:
-        console.print("[bold red]Error:[/bold red] Not authenticated with GitHub.")
-        console.print("Please run: [bold]gh auth login[/bold]")
-        sys.exit(1)
+async def check_gh_auth() -> bool:
+    """
+    Resolve the GitHub token used for all API requests.
+    
+    Prefers the GITHUB_TOKEN environment variable and falls back to a single
+    ``gh auth token`` call. The token is cached for the rest of the process.
+    
+    Returns:
+        True if a token was found, False otherwise; the token itself is only
+        checked by the first API request (see validate_repository)
+    """
+    global _token, _token_source, _token_error
+    if _token is None:
+        token = os.environ.get("GITHUB_TOKEN", "")
+        _token_source = "GITHUB_TOKEN"
+        if not token:
+            # Open the API connection while the gh subprocess runs; with
+            # GITHUB_TOKEN there is nothing to overlap it with
+            warmup = asyncio.ensure_future(warm_connection())
+            loop = asyncio.get_running_loop()
+            returncode, stdout, stderr = await loop.run_in_executor(None, run_gh_command, ["auth", "token"], False)
+            await warmup
+            token = stdout.strip() if returncode == 0 else ""
+            _token_source = "the GitHub CLI"
+            # Being logged out is reported as such; a hang or crash of gh is not
+            if returncode != 0 and "no oauth token" not in stderr.lower():
+                _token_error = stderr.strip() or f"gh exited with status {returncode}"
+        _token = token
+        if _token:
+            get_client().headers["Authorization"] = f"token {_token}"
+    return bool(_token)
 
 
-def validate_repository(repo: str) -> bool:
+def get_client() -> "httpx.AsyncClient":
+    """
+    Return the shared GitHub API client, creating it on first use.
+    
+    The client is created without credentials so its connection can be opened
+    before the token is known; check_gh_auth adds the Authorization header.
+    """
+    global _client
+    if _client is None:
+        import httpx
+
+        # Every request multiplexes over one kept-alive HTTP/2 connection
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=30),
+            retries=2,
+        )
+        _client = httpx.AsyncClient(
+            base_url=GITHUB_API_URL,
+            headers={"Accept": "application/vnd.github+json"},
+            timeout=GH_TIMEOUT,
+            transport=transport,
+        )
+    return _client
+
+
+async def warm_connection():
+    """
+    Open the TCP/TLS connection to the API ahead of the first real request.
+    
+    Sent outside the --concurrency limit so it never holds up a real request.
+    """
+    try:
+        await get_client().head("/")
+    except Exception:
+        # Best effort only; the first real request will connect instead
+        pass
+
+
+async def close_client():
+    """Close the shared GitHub API client if it was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def api_request(method: str, url: str, **kwargs: Any) -> Tuple[Optional["httpx.Response"], str]:
+    """
+    Send a GitHub API request, reporting network failures instead of raising.
+    
+    Every request waits for a slot under the --concurrency limit, so polls and
+    pre-flight checks count against it as much as the removals and invites.
+    
+    Args:
+        method: HTTP method
+        url: Path relative to the API base URL
+        **kwargs: Passed through to httpx
+        
+    Returns:
+        Tuple of (response, error); response is None and error describes the
+        failure when no response was received
+    """
+    import httpx
+
+    try:
+        if _request_limit is None:
+            return await get_client().request(method, url, **kwargs), ""
+        async with _request_limit:
+            return await get_client().request(method, url, **kwargs), ""
+    except httpx.HTTPError as e:
+        return None, str(e) or type(e).__name__
+
+
+def api_error(response: Optional["httpx.Response"], error: str = "") -> str:
+    """Extract a human readable error message from a failed API request."""
+    if response is None:
+        return error
+    try:
+        return json_loads(response.content).get("message", response.reason_phrase)
+    except ValueError:
+        return response.reason_phrase
+
+
+async def validate_repository(repo: str) -> bool:
     """
     Validate repository format and existence.
     
@@ -66,22 +275,89 @@ def validate_repository(repo: str) -> bool:
         True if valid, False otherwise
     """
     if "/" not in repo:
-        console.print(f"[bold red]Error:[/bold red] Invalid repository format: {repo}")
-        console.print("Use format: owner/repository")
+        _console().print(f"[bold red]Error:[/bold red] Invalid repository format: {repo}")
+        _console().print("Use format: owner/repository")
         return False
     
-    # Check if repository exists and is accessible
-    returncode, _, stderr = run_gh_command(["repo", "view", repo, "--json", "name"], check=False)
-    if returncode != 0:
-        console.print(f"[bold red]Error:[/bold red] Cannot access repository: {repo}")
-        if "not found" in stderr.lower():
-            console.print("Repository not found or you don't have access.")
+    # Check if repository exists and is accessible; HEAD skips the metadata body
+    # and a 304 against a cached ETag confirms access without using rate limit
+    etags = load_etags()
+    cached = etags.get(repo)
+    headers = {}
+    if cached and time.time() - cached["stored"] < ETAG_CACHE_TTL:
+        headers["If-None-Match"] = cached["etag"]
+    
+    response, error = await api_request("HEAD", f"/repos/{repo}", headers=headers)
+    if response is None:
+        _console().print(f"[bold red]Error:[/bold red] Cannot access repository: {repo} ({error})")
+        return False
+    if response.status_code == 304:
+        return True
+    if response.status_code == 401:
+        _console().print(f"[bold red]Error:[/bold red] GitHub rejected the token from {_token_source} as invalid or expired.")
+        if _token_source == "GITHUB_TOKEN":
+            _console().print("Please update GITHUB_TOKEN, or unset it and run: [bold]gh auth login[/bold]")
+        else:
+            _console().print("Please run: [bold]gh auth login[/bold]")
+        return False
+    if response.status_code != 200:
+        _console().print(f"[bold red]Error:[/bold red] Cannot access repository: {repo}")
+        if response.status_code == 404:
+            _console().print("Repository not found or you don't have access.")
         return False
     
+    etag = response.headers.get("ETag")
+    if etag:
+        etags[repo] = {"etag": etag, "stored": time.time()}
+        save_etags(etags)
+    
     return True
 
 
-def check_collaborator(repo: str, username: str) -> bool:
+def etag_cache_path() -> Optional[Path]:
+    """Locate the repository ETag cache, or None if there is no home directory for it."""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    if not cache_home:
+        try:
+            cache_home = str(Path.home() / ".cache")
+        except (KeyError, RuntimeError):
+            return None
+    return Path(cache_home) / "gh-reinvite" / "etags.json"
+
+
+def load_etags() -> Dict[str, Dict[str, Any]]:
+    """Read the repository ETag cache, treating a missing or corrupt file as empty."""
+    path = etag_cache_path()
+    if path is None:
+        return {}
+    try:
+        etags = json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(etags, dict):
+        return {}
+    # Skip entries this version could not have written rather than failing on them
+    return {
+        repo: entry for repo, entry in etags.items()
+        if isinstance(entry, dict)
+        and isinstance(entry.get("etag"), str)
+        and isinstance(entry.get("stored"), (int, float))
+    }
+
+
+def save_etags(etags: Dict[str, Dict[str, Any]]):
+    """Write the repository ETag cache; failures only cost a future round-trip."""
+    path = etag_cache_path()
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(etags))
+    except OSError:
+        pass
+
+
+async def check_collaborator(repo: str, username: str) -> bool:
     """
     Check if user is a collaborator on the repository.
     
@@ -92,66 +368,196 @@ def check_collaborator(repo: str, username: str) -> bool:
     Returns:
         True if user is a collaborator, False otherwise
     """
-    returncode, stdout, _ = run_gh_command(
-        ["api", f"repos/{repo}/collaborators/{username}"],
-        check=False
-    )
-    return returncode == 0
+    response, _ = await api_request("GET", f"/repos/{repo}/collaborators/{username}")
+    return response is not None and response.status_code == 204
 
 
-def check_pending_invitation(repo: str, username: str) -> int:
+async def still_collaborator(repo: str, username: str) -> bool:
     """
-    Check if user has a pending invitation to the repository.
+    Check whether a removed collaborator is still reported on the repository.
+    
+    Only a 404 counts as gone; network errors, rate limits and server errors
+    leave the removal unconfirmed so polling carries on.
     
     Args:
         repo: Repository in owner/name format
         username: GitHub username
         
     Returns:
-        Invitation ID if found, 0 otherwise
+        False once GitHub reports the user is not a collaborator, True otherwise
     """
-    returncode, stdout, _ = run_gh_command(
-        ["api", f"repos/{repo}/invitations"],
-        check=False
-    )
+    response, _ = await api_request("GET", f"/repos/{repo}/collaborators/{username}")
+    return response is None or response.status_code != 404
+
+
+async def check_collaborator_permission(repo: str, username: str) -> Optional[str]:
+    """
+    Get the permission a user is directly granted on the repository.
+    
+    Team and organization grants are left out: they are what the
+    /permission endpoint reports on top, but a PUT never changes them.
+    
+    Args:
+        repo: Repository in owner/name format
+        username: GitHub username
+        
+    Returns:
+        Permission name as accepted by invite_collaborator, or None if the
+        user has no direct grant or it could not be determined
+    """
+    if repo not in _direct_permissions:
+        _direct_permissions[repo] = asyncio.ensure_future(fetch_direct_permissions(repo))
+    permissions = await _direct_permissions[repo]
+    return permissions.get(username.casefold()) if permissions is not None else None
+
+
+async def fetch_direct_permissions(repo: str) -> Optional[Dict[str, str]]:
+    """
+    List the permission of every direct collaborator on the repository.
     
-    if returncode == 0 and stdout:
+    Args:
+        repo: Repository in owner/name format
+        
+    Returns:
+        Permission names keyed by casefolded login, or None if any page failed
+    """
+    permissions: Dict[str, str] = {}
+    page = 1
+    while True:
+        response, _ = await api_request(
+            "GET",
+            f"/repos/{repo}/collaborators",
+            params={"affiliation": "direct", "per_page": COLLABORATORS_PAGE_SIZE, "page": page}
+        )
+        if response is None or response.status_code != 200:
+            return None
         try:
-            invitations = json.loads(stdout)
-            for invitation in invitations:
-                if invitation.get("invitee", {}).get("login", "").lower() == username.lower():
-                    return invitation.get("id", 0)
-        except json.JSONDecodeError:
-            pass
+            batch = json_loads(response.content)
+        except ValueError:
+            return None
+        
+        for collaborator in batch:
+            login, role = collaborator.get("login"), collaborator.get("role_name")
+            if login and role:
+                permissions[login.casefold()] = ROLE_PERMISSIONS.get(role, role)
+        if len(batch) < COLLABORATORS_PAGE_SIZE:
+            return permissions
+        page += 1
+
+
+async def check_pending_invitation(
+    repo: str, username: str, fresh_after: Optional[float] = None, max_pages: int = 0
+) -> int:
+    """
+    Check if user has a pending invitation to the repository.
+    
+    Args:
+        repo: Repository in owner/name format
+        username: GitHub username
+        fresh_after: Only trust cached invitations dropped and refetched after
+            this time.monotonic() value; older ones are fetched again
+        max_pages: Fetch at most this many more pages (0 for no limit); a
+            later call carries on where this one stopped
+        
+    Returns:
+        Invitation ID if found, 0 otherwise
+    """
+    # Serialize lookups per repository so concurrent callers share fetched pages
+    async with _invitation_lock(repo):
+        # Concurrent pollers share one refetch instead of each starting over
+        if fresh_after is not None and _invitations_since.get(repo, -math.inf) < fresh_after:
+            forget_invitations(repo)
+        
+        login = username.casefold()
+        invitations = _invitations.setdefault(repo, {})
+        if login in invitations:
+            return invitations[login]
+        
+        # Fetch further pages only until the invitee turns up
+        fetched = 0
+        while (page := _invitation_next_page.get(repo, 1)) and (not max_pages or fetched < max_pages):
+            fetched += 1
+            response, _ = await api_request(
+                "GET",
+                f"/repos/{repo}/invitations",
+                params={"per_page": INVITATIONS_PAGE_SIZE, "page": page},
+                timeout=INVITATIONS_TIMEOUT
+            )
+            if response is None or response.status_code != 200:
+                break
+            try:
+                batch = json_loads(response.content)
+            except ValueError:
+                break
+            
+            invitations.update({
+                invitation["invitee"]["login"].casefold(): invitation.get("id", 0)
+                for invitation in batch if invitation.get("invitee")
+            })
+            _invitation_next_page[repo] = page + 1 if len(batch) == INVITATIONS_PAGE_SIZE else 0
+            if login in invitations:
+                return invitations[login]
     
     return 0
 
 
-def remove_pending_invitation(repo: str, invitation_id: int) -> bool:
+def _invitation_lock(repo: str) -> asyncio.Lock:
+    """Return the lock guarding the cached invitations of a repository."""
+    return _invitation_locks.setdefault(repo, asyncio.Lock())
+
+
+def forget_invitations(repo: str):
+    """Drop the cached pending invitations for a repository; hold its lock."""
+    _invitations.pop(repo, None)
+    _invitation_next_page.pop(repo, None)
+    _invitations_since[repo] = time.monotonic()
+
+
+async def invitation_pending(repo: str, username: str, fresh_after: float) -> bool:
+    """
+    Check whether a removed invitation is still reported on the repository.
+    
+    Args:
+        repo: Repository in owner/name format
+        username: GitHub username the invitation was sent to
+        fresh_after: time.monotonic() value the invitations must be newer than
+        
+    Returns:
+        False once a complete listing no longer has the invitation, True otherwise
+    """
+    if await check_pending_invitation(repo, username, fresh_after=fresh_after):
+        return True
+    # A listing cut short by a failed page cannot confirm the removal
+    return _invitation_next_page.get(repo, 1) != 0
+
+
+async def remove_pending_invitation(repo: str, username: str, invitation_id: int) -> bool:
     """
     Remove a pending invitation from the repository.
     
     Args:
         repo: Repository in owner/name format
+        username: GitHub username the invitation was sent to
         invitation_id: The invitation ID to remove
         
     Returns:
         True if successful, False otherwise
     """
-    returncode, _, stderr = run_gh_command(
-        ["api", "-X", "DELETE", f"repos/{repo}/invitations/{invitation_id}"],
-        check=False
-    )
+    response, error = await api_request("DELETE", f"/repos/{repo}/invitations/{invitation_id}")
     
-    if returncode == 0:
-        console.print(f"[green]✓[/green] Successfully removed pending invitation")
+    # The cached invitation list no longer reflects the repository
+    async with _invitation_lock(repo):
+        forget_invitations(repo)
+    
+    if response is not None and response.status_code == 204:
+        _console().print(_mark(OK), f"Successfully removed pending invitation for [bold]{username}[/bold]")
         return True
     else:
-        console.print(f"[red]✗[/red] Failed to remove pending invitation: {stderr}")
+        _console().print(_mark(FAIL), f"Failed to remove pending invitation for [bold]{username}[/bold]: {api_error(response, error)}")
         return False
 
 
-def remove_collaborator(repo: str, username: str) -> bool:
+async def remove_collaborator(repo: str, username: str) -> bool:
     """
     Remove a collaborator from a repository.
     
@@ -162,20 +568,43 @@ def remove_collaborator(repo: str, username: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    returncode, _, stderr = run_gh_command(
-        ["api", "-X", "DELETE", f"repos/{repo}/collaborators/{username}"],
-        check=False
+    response, error = await api_request("DELETE", f"/repos/{repo}/collaborators/{username}")
+    
+    if response is not None and response.status_code == 204:
+        _console().print(_mark(OK), f"Successfully removed [bold]{username}[/bold] from [bold]{repo}[/bold]")
+        return True
+    else:
+        _console().print(_mark(FAIL), f"Failed to remove collaborator: {api_error(response, error)}")
+        return False
+
+
+async def update_permission(repo: str, username: str, permission: str) -> bool:
+    """
+    Change the permission level of an existing collaborator in place.
+    
+    Args:
+        repo: Repository in owner/name format
+        username: GitHub username of the collaborator
+        permission: Permission level (pull, triage, push, maintain, admin)
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    response, error = await api_request(
+        "PUT",
+        f"/repos/{repo}/collaborators/{username}",
+        json={"permission": permission}
     )
     
-    if returncode == 0:
-        console.print(f"[green]✓[/green] Successfully removed [bold]{username}[/bold] from [bold]{repo}[/bold]")
+    if response is not None and response.status_code == 204:
+        _console().print(_mark(OK), f"Successfully changed [bold]{username}[/bold]'s permission on [bold]{repo}[/bold] to [bold]{permission}[/bold]")
         return True
     else:
-        console.print(f"[red]✗[/red] Failed to remove collaborator: {stderr}")
+        _console().print(_mark(FAIL), f"Failed to change permission: {api_error(response, error)}")
         return False
 
 
-def invite_collaborator(repo: str, username: str, permission: str) -> bool:
+async def invite_collaborator(repo: str, username: str, permission: str) -> bool:
     """
     Invite a collaborator to a repository with specified permissions.
     
@@ -187,147 +616,389 @@ def invite_collaborator(repo: str, username: str, permission: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    returncode, stdout, stderr = run_gh_command(
-        ["api", "-X", "PUT", f"repos/{repo}/collaborators/{username}",
-         "-f", f"permission={permission}"],
-        check=False
+    response, error = await api_request(
+        "PUT",
+        f"/repos/{repo}/collaborators/{username}",
+        json={"permission": permission}
     )
     
-    if returncode == 0:
-        console.print(f"[green]✓[/green] Successfully invited [bold]{username}[/bold] to [bold]{repo}[/bold] with [bold]{permission}[/bold] permissions")
+    if response is not None and response.status_code in (201, 204):
+        _console().print(_mark(OK), f"Successfully invited [bold]{username}[/bold] to [bold]{repo}[/bold] with [bold]{permission}[/bold] permissions")
         return True
     else:
-        console.print(f"[red]✗[/red] Failed to invite collaborator: {stderr}")
+        _console().print(_mark(FAIL), f"Failed to invite collaborator: {api_error(response, error)}")
         return False
 
 
-def countdown_delay(seconds: int):
-    """Display a countdown for the specified delay."""
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task(f"Waiting {seconds} seconds before reinviting...", total=seconds)
-        for i in range(seconds):
-            progress.update(task, description=f"Waiting {seconds - i} seconds before reinviting...")
-            time.sleep(1)
-            progress.update(task, advance=1)
-
-
-@click.command()
-@click.argument('repository')
-@click.argument('username')
-@click.option('--delay', '-d', default=5, type=int, help='Delay in seconds between remove and reinvite (default: 5)')
-@click.option('--permission', '-p', default='push', 
-              type=click.Choice(VALID_PERMISSIONS, case_sensitive=False),
-              help='Permission level for reinvite (default: push)')
-@click.option('--yes', '-y', is_flag=True, help='Skip confirmation prompt')
-@click.version_option(version='0.2.0', prog_name='gh-reinvite')
-def main(repository: str, username: str, delay: int, permission: str, yes: bool):
+async def wait_for_removal(
+    progress: "Progress", username: str, still_present: Callable[[], Awaitable[Any]], seconds: int
+) -> bool:
     """
-    GitHub Reinvite Tool - Remove and reinvite a collaborator from/to a GitHub repository.
+    Poll GitHub until a removal is visible, backing off exponentially.
     
-    This tool automates the process of removing a collaborator from a GitHub repository,
-    waiting for a specified delay, and then reinviting them with the specified permissions.
-    
-    REPOSITORY: GitHub repository in owner/name format
-    USERNAME: GitHub username to remove and reinvite
+    Args:
+        progress: Live progress display to show the wait on
+        username: GitHub username whose removal is awaited
+        still_present: Coroutine function returning a truthy value while the
+            removed collaborator or invitation is still reported
+        seconds: Maximum number of seconds to wait
+        
+    Returns:
+        True if the removal was observed before the deadline, False otherwise
     """
+    task = progress.add_task(f"Waiting up to {seconds} seconds for GitHub to process the removal of {username}...")
+    try:
+        deadline = time.monotonic() + seconds
+        interval = POLL_INITIAL_INTERVAL
+        while await still_present():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            progress.update(
+                task,
+                description=f"Waiting up to {math.ceil(remaining)} seconds for GitHub to process the removal of {username}..."
+            )
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * 2, POLL_MAX_INTERVAL)
+        return True
+    finally:
+        progress.remove_task(task)
+
+
+async def _track(progress: "Progress", description: str, awaitable: Awaitable[T]) -> T:
+    """Show a spinner task on progress while awaiting, then remove it."""
+    task = progress.add_task(description)
+    try:
+        return await awaitable
+    finally:
+        progress.remove_task(task)
+
+
+def count_users(count: int) -> str:
+    """Phrase a number of users, e.g. "1 user" or "3 users"."""
+    return f"{count} user" if count == 1 else f"{count} users"
+
+
+def unique_usernames(usernames: Sequence[str]) -> List[str]:
+    """Drop repeats of a username in any letter case, keeping the first spelling and the order."""
+    seen = set()
+    unique = []
+    for username in usernames:
+        login = username.casefold()
+        if login not in seen:
+            seen.add(login)
+            unique.append(username)
+    return unique
+
+
+async def amain(
+    repository: str, usernames: Sequence[str], delay: int, permission: str, yes: bool, concurrency: int,
+    force: bool = False
+):
+    """Run the reinvite workflow, closing the API client when done."""
+    global _request_limit
+    # Click has already checked the option; this covers other callers of amain
+    permission = permission.lower()
+    if permission not in VALID_PERMISSIONS:
+        _console().print(f"[bold red]Error:[/bold red] Invalid permission: {permission}")
+        _console().print(f"Use one of: {', '.join(PERMISSION_CHOICES)}")
+        sys.exit(1)
+    
+    _request_limit = asyncio.Semaphore(concurrency)
+    # Not try/finally: compiled with mypyc, an await in that finally re-raises
+    # an exception left over from an earlier amain call in the same process
+    try:
+        await _reinvite(repository, unique_usernames(usernames), delay, permission, yes, force)
+    except BaseException:
+        await close_client()
+        raise
+    await close_client()
+
+
+async def _reinvite(
+    repository: str, usernames: Sequence[str], delay: int, permission: str, yes: bool, force: bool
+):
+    """Remove and reinvite each of the given collaborators."""
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.prompt import Confirm
+
+    console = _console()
+    bulk = len(usernames) > 1
     
     # Display header
     console.print(Panel.fit(
         "[bold blue]GitHub Reinvite Tool[/bold blue]\n"
         f"Repository: [bold]{repository}[/bold]\n"
-        f"User: [bold]{username}[/bold]\n"
+        f"{'Users' if bulk else 'User'}: [bold]{', '.join(usernames)}[/bold]\n"
         f"Delay: [bold]{delay}[/bold] seconds\n"
         f"Permission: [bold]{permission}[/bold]",
         title="Configuration"
     ))
     
-    # Check GitHub CLI authentication
-    with console.status("Checking GitHub authentication..."):
-        check_gh_auth()
-    console.print("[green]✓[/green] GitHub CLI authenticated")
-    
-    # Validate repository
-    with console.status(f"Validating repository {repository}..."):
-        if not validate_repository(repository):
+    # One live display shows a spinner per pre-flight check while it runs
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True,
+    ) as progress:
+        # Resolve the token every API request depends on
+        auth_ok = await _track(progress, "Checking GitHub authentication...", check_gh_auth())
+        
+        if not auth_ok:
+            if _token_error:
+                console.print(f"[bold red]Error:[/bold red] Could not get a token from the GitHub CLI: {_token_error}")
+            else:
+                console.print("[bold red]Error:[/bold red] Not authenticated with GitHub.")
+                console.print("Please run: [bold]gh auth login[/bold]")
             sys.exit(1)
-    console.print(f"[green]✓[/green] Repository [bold]{repository}[/bold] is accessible")
+        console.print(_mark(OK), f"Using GitHub token from {_token_source}")
+        
+        # Run the independent pre-flight checks concurrently. Separate tasks
+        # rather than gather, whose list result compiled code rejects as a tuple
+        repo_check = asyncio.ensure_future(
+            _track(progress, f"Validating repository {repository}...", validate_repository(repository)))
+        status_checks = [
+            asyncio.ensure_future(_track(
+                progress, f"Checking status of {username}...", check_status(repository, username, not force)))
+            for username in usernames
+        ]
+        repo_ok = await repo_check
+        statuses: List[UserStatus] = []
+        for status_check in status_checks:
+            statuses.append(await status_check)
     
-    # Check if user is a collaborator
-    with console.status(f"Checking if {username} is a collaborator..."):
-        is_collaborator = check_collaborator(repository, username)
+    if not repo_ok:
+        sys.exit(1)
+    console.print(_mark(OK), f"Repository [bold]{repository}[/bold] is accessible")
     
-    if not is_collaborator:
-        console.print(f"[yellow]⚠[/yellow] [bold]{username}[/bold] is not currently a collaborator on [bold]{repository}[/bold]")
-        
-        # Check for pending invitation
-        with console.status(f"Checking for pending invitation..."):
-            invitation_id = check_pending_invitation(repository, username)
-        
-        if invitation_id:
-            console.print(f"[yellow]⚠[/yellow] Found pending invitation for [bold]{username}[/bold]")
-            
-            # Confirmation prompt for pending invitation
-            if not yes:
-                if not Confirm.ask(f"Remove pending invitation and reinvite [bold]{username}[/bold]?"):
-                    console.print("Operation cancelled.")
-                    sys.exit(0)
-            
-            # Remove pending invitation
-            console.print("\n[bold]Step 1:[/bold] Removing pending invitation...")
-            if not remove_pending_invitation(repository, invitation_id):
-                console.print("[red]Failed to remove pending invitation. Aborting.[/red]")
-                sys.exit(1)
+    for username, status in zip(usernames, statuses):
+        is_collaborator, invitation_id, current_permission = status
+        if is_collaborator:
+            if current_permission:
+                console.print(_mark(OK), f"[bold]{username}[/bold] is currently a collaborator with [bold]{current_permission}[/bold] permissions")
+            else:
+                console.print(_mark(OK), f"[bold]{username}[/bold] is currently a collaborator")
         else:
-            console.print("[yellow]⚠[/yellow] No pending invitation found")
-            
-            # Confirmation prompt for new invitation
-            if not yes:
-                if not Confirm.ask(f"Invite [bold]{username}[/bold] to [bold]{repository}[/bold]?"):
-                    console.print("Operation cancelled.")
-                    sys.exit(0)
+            console.print(_mark(WARN), f"[bold]{username}[/bold] is not currently a collaborator on [bold]{repository}[/bold]")
+            if invitation_id:
+                console.print(_mark(WARN), f"Found pending invitation for [bold]{username}[/bold]")
+            else:
+                console.print(_mark(WARN), f"No pending invitation found for [bold]{username}[/bold]")
+    
+    # Users needing only a permission change are counted apart from reinvites
+    updated = sum(updates_in_place(status, permission, force) for status in statuses)
+    reinvited = len(usernames) - updated
+    
+    # Confirmation prompt
+    if not yes:
+        is_collaborator, invitation_id, current_permission = statuses[0]
+        if bulk:
+            actions = []
+            if reinvited:
+                actions.append(f"remove and reinvite {count_users(reinvited)}")
+            if updated:
+                actions.append(f"change the permission of {count_users(updated)} to [bold]{permission}[/bold]")
+            question = f"{' and '.join(actions)} on [bold]{repository}[/bold]?"
+            question = question[0].upper() + question[1:]
+        elif updates_in_place(statuses[0], permission, force):
+            question = (f"Change [bold]{usernames[0]}[/bold]'s permission on [bold]{repository}[/bold] "
+                        f"from [bold]{current_permission}[/bold] to [bold]{permission}[/bold]?")
+        elif is_collaborator:
+            question = f"Remove [bold]{usernames[0]}[/bold] from [bold]{repository}[/bold] and reinvite them?"
+        elif invitation_id:
+            question = f"Remove pending invitation and reinvite [bold]{usernames[0]}[/bold]?"
+        else:
+            question = f"Invite [bold]{usernames[0]}[/bold] to [bold]{repository}[/bold]?"
+        if not Confirm.ask(question):
+            console.print("Operation cancelled.")
+            sys.exit(0)
+    
+    # Reinvite every user concurrently, sharing one live display for the waits;
+    # the API request limit keeps bulk runs from flooding GitHub
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True,
+    ) as progress:
+        labels = [f"[bold]{username}[/bold]: " if bulk else "" for username in usernames]
+        results: List[bool] = await asyncio.gather(*[
+            _contained(label, reinvite_one(
+                progress, repository, username, status, delay, permission, force, label=label
+            ))
+            for username, status, label in zip(usernames, statuses, labels)
+        ])
+    
+    failed = [username for username, ok in zip(usernames, results) if not ok]
+    if failed:
+        if bulk:
+            console.print(f"\n[red]Failed to reinvite: {', '.join(failed)}[/red]")
+        sys.exit(1)
+    
+    console.print("\n[bold green]✓ Operation completed successfully![/bold green]")
+    if bulk:
+        if reinvited:
+            console.print(f"[bold]{count_users(reinvited)}[/bold] {'has' if reinvited == 1 else 'have'} been reinvited "
+                          f"to [bold]{repository}[/bold] with [bold]{permission}[/bold] permissions.")
+        if updated:
+            console.print(f"[bold]{count_users(updated)}[/bold] now {'has' if updated == 1 else 'have'} "
+                          f"[bold]{permission}[/bold] permissions on [bold]{repository}[/bold].")
+    elif updates_in_place(statuses[0], permission, force):
+        console.print(f"[bold]{usernames[0]}[/bold] now has [bold]{permission}[/bold] permissions on [bold]{repository}[/bold].")
     else:
-        console.print(f"[green]✓[/green] [bold]{username}[/bold] is currently a collaborator")
+        console.print(f"[bold]{usernames[0]}[/bold] has been reinvited to [bold]{repository}[/bold] with [bold]{permission}[/bold] permissions.")
+
+
+async def check_status(repo: str, username: str, with_permission: bool = True) -> UserStatus:
+    """
+    Check collaborator status, permission and pending invitation for a user.
+    
+    The first invitations page is fetched alongside the collaborator check;
+    later pages are only read once the user turns out not to be a collaborator,
+    and the permission only once they turn out to be one.
+    
+    Args:
+        repo: Repository in owner/name format
+        username: GitHub username
+        with_permission: Look up a collaborator's direct permission grant
+        
+    Returns:
+        The user's status; collaborators have no invitation ID and others no permission
+    """
+    collaborator_check = asyncio.ensure_future(check_collaborator(repo, username))
+    invitation_id = await check_pending_invitation(repo, username, max_pages=1)
+    if await collaborator_check:
+        permission = await check_collaborator_permission(repo, username) if with_permission else None
+        return UserStatus(True, 0, permission)
+    if not invitation_id:
+        invitation_id = await check_pending_invitation(repo, username)
+    return UserStatus(False, invitation_id, None)
+
+
+def updates_in_place(status: UserStatus, permission: str, force: bool) -> bool:
+    """
+    Decide whether a permission change alone achieves the reinvite.
+    
+    An existing collaborator whose direct grant differs from the requested
+    permission only needs a PUT; removing and reinviting is reserved for an
+    unchanged grant (to resend the invitation), a grant that could not be
+    determined, or when forced.
+    """
+    return (
+        status.is_collaborator
+        and not force
+        and status.permission is not None
+        and status.permission != permission
+    )
+
+
+async def reinvite_one(
+    progress: "Progress",
+    repository: str,
+    username: str,
+    status: UserStatus,
+    delay: int,
+    permission: str,
+    force: bool,
+    label: str = "",
+) -> bool:
+    """
+    Remove a user's access or pending invitation, wait for it, and reinvite them.
+    
+    Args:
+        progress: Live progress display shared by all users
+        repository: Repository in owner/name format
+        username: GitHub username to reinvite
+        status: The user's pre-flight status
+        delay: Maximum seconds to wait for the removal
+        permission: Permission level for the reinvite
+        force: Remove and reinvite even when a permission update would do
+        label: Prefix identifying the user on step messages
+        
+    Returns:
+        True if the user was reinvited, False otherwise
+    """
+    console = _console()
+    
+    # A changed permission on an existing collaborator is a single PUT
+    if updates_in_place(status, permission, force):
+        console.print(f"\n{label}[bold]Step 1:[/bold] Updating permission from {status.permission} to {permission}...")
+        updated = await update_permission(repository, username, permission)
+        if not updated:
+            console.print(f"{label}[red]Failed to update permission.[/red]")
+        return updated
+    
+    is_collaborator, invitation_id, _ = status
+    
+    # Polls whatever step 1 removed until GitHub stops reporting it
+    still_present: Optional[Callable[[], Awaitable[Any]]] = None
+    
+    if is_collaborator:
+        console.print(f"\n{label}[bold]Step 1:[/bold] Removing collaborator...")
+        removed = await remove_collaborator(repository, username)
+        if not removed:
+            console.print(f"{label}[red]Failed to remove collaborator. Aborting.[/red]")
+            return False
+        still_present = partial(still_collaborator, repository, username)
+    elif invitation_id:
+        console.print(f"\n{label}[bold]Step 1:[/bold] Removing pending invitation...")
+        removed = await remove_pending_invitation(repository, username, invitation_id)
+        if not removed:
+            console.print(f"{label}[red]Failed to remove pending invitation. Aborting.[/red]")
+            return False
+        polled_at = time.monotonic()
         
-        # Confirmation prompt
-        if not yes:
-            if not Confirm.ask(f"Remove [bold]{username}[/bold] from [bold]{repository}[/bold] and reinvite them?"):
-                console.print("Operation cancelled.")
-                sys.exit(0)
+        async def still_invited() -> bool:
+            # Each poll needs invitations fetched after the previous one finished
+            nonlocal polled_at
+            pending = await invitation_pending(repository, username, polled_at)
+            polled_at = time.monotonic()
+            return pending
         
-        # Remove collaborator
-        console.print("\n[bold]Step 1:[/bold] Removing collaborator...")
-        if not remove_collaborator(repository, username):
-            console.print("[red]Failed to remove collaborator. Aborting.[/red]")
-            sys.exit(1)
+        still_present = still_invited
     
-    # Delay
-    if delay > 0:
-        console.print(f"\n[bold]Step 2:[/bold] Waiting {delay} seconds...")
-        countdown_delay(delay)
+    # Wait until GitHub reports the removal, for at most the configured delay
+    if still_present is not None and delay > 0:
+        console.print(f"\n{label}[bold]Step 2:[/bold] Waiting for GitHub to process the removal (up to {delay} seconds)...")
+        started = time.monotonic()
+        if await wait_for_removal(progress, username, still_present, delay):
+            console.print(_mark(OK), f"{label}Removal confirmed after {time.monotonic() - started:.2f} seconds")
+        else:
+            console.print(_mark(WARN), f"{label}Removal not yet visible after {delay} seconds, reinviting anyway")
     
     # Reinvite collaborator
-    console.print("\n[bold]Step 3:[/bold] Reinviting collaborator...")
-    if not invite_collaborator(repository, username, permission):
-        console.print("[red]Failed to reinvite collaborator.[/red]")
-        sys.exit(1)
-    
-    console.print("\n[bold green]✓ Operation completed successfully![/bold green]")
-    console.print(f"[bold]{username}[/bold] has been reinvited to [bold]{repository}[/bold] with [bold]{permission}[/bold] permissions.")
+    console.print(f"\n{label}[bold]Step 3:[/bold] Reinviting collaborator...")
+    invited = await invite_collaborator(repository, username, permission)
+    if not invited:
+        console.print(f"{label}[red]Failed to reinvite collaborator.[/red]")
+        return False
+    return True
+
+
+async def _contained(label: str, awaitable: Awaitable[bool]) -> bool:
+    """Await one user's work, reporting an unexpected error as that user's failure."""
+    # Otherwise the error would abort gather and strand the other users removed
+    try:
+        return await awaitable
+    except Exception as e:
+        _console().print(_mark(FAIL), f"{label}[red]Unexpected error: {e}[/red]")
+        return False
 
 
 def run():
-    """Entry point for the CLI."""
+    """Entry point for the CLI; the console script enters through __main__.run."""
+    # The Click command lives outside this module so mypyc can compile it
+    from ._command import main
+
     try:
         main()
     except KeyboardInterrupt:
-        console.print("\n[yellow]Operation cancelled by user.[/yellow]")
+        _console().print("\n[yellow]Operation cancelled by user.[/yellow]")
         sys.exit(1)
     except Exception as e:
-        console.print(f"[bold red]Unexpected error:[/bold red] {e}")
+        _console().print(f"[bold red]Unexpected error:[/bold red] {e}")
         sys.exit(1)
 
 
@@ -0,0 +1,230 @@
+"""
+Tests for the reinvite workflow against a mocked GitHub API.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from gh_reinvite import cli
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(monkeypatch, tmp_path):
+    """Give each test fresh module state and a private ETag cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(cli, "_token", "token")
+    monkeypatch.setattr(cli, "_token_source", "GITHUB_TOKEN")
+    monkeypatch.setattr(cli, "_client", None)
+    monkeypatch.setattr(cli, "_invitations", {})
+    monkeypatch.setattr(cli, "_invitation_next_page", {})
+    monkeypatch.setattr(cli, "_invitations_since", {})
+    monkeypatch.setattr(cli, "_invitation_locks", {})
+    monkeypatch.setattr(cli, "_direct_permissions", {})
+
+
+def mock_github(collaborators, fail_put_for=None, error=None, direct=None):
+    """
+    Route API requests to a fake repository whose collaborators can be removed.
+
+    Args:
+        collaborators: Lowercase logins that start out as collaborators
+        fail_put_for: Login whose reinvite raises error instead of responding
+        error: Exception raised for that reinvite
+        direct: Role names of direct grants by login, or None to fail that listing
+
+    Returns:
+        Tuple of (transport, list of (method, path) for every request seen)
+    """
+    requests = []
+
+    def handler(request):
+        path = request.url.path
+        requests.append((request.method, path))
+        if path.endswith("/invitations"):
+            return httpx.Response(200, json=[])
+        if path.endswith("/collaborators"):
+            if direct is None:
+                return httpx.Response(502)
+            return httpx.Response(200, json=[{"login": login, "role_name": role} for login, role in direct.items()])
+        if "/collaborators/" not in path:
+            return httpx.Response(200)
+
+        login = path.split("/collaborators/")[1].split("/")[0]
+        if path.endswith("/permission"):
+            # The effective permission, raised by a team grant
+            return httpx.Response(200, json={"role_name": "maintain"})
+        if request.method == "GET":
+            return httpx.Response(204 if login in collaborators else 404)
+        if request.method == "DELETE":
+            collaborators.discard(login)
+            return httpx.Response(204)
+        if login == fail_put_for:
+            raise error
+        # 204 updates an existing collaborator, 201 sends a new invitation
+        return httpx.Response(204 if login in collaborators else 201)
+
+    return httpx.MockTransport(handler), requests
+
+
+@pytest.mark.parametrize("error", [
+    httpx.ReadTimeout("timed out"),
+    RuntimeError("connection pool exploded"),
+])
+def test_one_failed_reinvite_does_not_strand_the_others(capsys, error):
+    transport, requests = mock_github({"alice", "bob", "carol"}, "alice", error)
+    cli._client = httpx.AsyncClient(base_url=cli.GITHUB_API_URL, transport=transport)
+
+    with pytest.raises(SystemExit) as exit_info:
+        asyncio.run(cli.amain("octocat/hello-world", ["alice", "bob", "carol"], 1, "push", True, 8, True))
+
+    assert exit_info.value.code == 1
+    for login in ("alice", "bob", "carol"):
+        assert ("PUT", f"/repos/octocat/hello-world/collaborators/{login}") in requests
+    output = capsys.readouterr().out
+    assert "Failed to reinvite: alice" in output
+
+
+def test_load_etags_drops_malformed_entries(tmp_path):
+    cache = tmp_path / "gh-reinvite" / "etags.json"
+    cache.parent.mkdir()
+    cache.write_text(
+        '{"o/bare": "x", "o/no-etag": {"stored": 1}, "o/bad-stored": {"etag": "e", "stored": "now"},'
+        ' "o/good": {"etag": "\\"abc\\"", "stored": 1.5}}'
+    )
+
+    assert cli.load_etags() == {"o/good": {"etag": '"abc"', "stored": 1.5}}
+
+
+def run_amain(usernames, permission, force=False):
+    """Run the workflow non-interactively, returning its exit code."""
+    try:
+        asyncio.run(cli.amain("octocat/hello-world", usernames, 1, permission, True, 8, force))
+    except SystemExit as e:
+        return e.code
+    return 0
+
+
+@pytest.mark.parametrize("direct, expect_delete", [
+    # Direct push plus maintain through a team: resend the invitation
+    ({"alice": "write"}, True),
+    # Direct grant differs from the requested one: a PUT is enough
+    ({"alice": "read"}, False),
+    # Direct grant unknown: fall back to remove and reinvite
+    (None, True),
+])
+def test_in_place_update_follows_the_direct_grant(direct, expect_delete):
+    transport, requests = mock_github({"alice"}, direct=direct)
+    cli._client = httpx.AsyncClient(base_url=cli.GITHUB_API_URL, transport=transport)
+
+    assert run_amain(["alice"], "push") == 0
+
+    assert (("DELETE", "/repos/octocat/hello-world/collaborators/alice") in requests) == expect_delete
+    assert ("PUT", "/repos/octocat/hello-world/collaborators/alice") in requests
+
+
+def test_mixed_bulk_run_counts_updates_apart_from_reinvites(monkeypatch, capsys):
+    from rich.prompt import Confirm
+
+    questions = []
+    monkeypatch.setattr(Confirm, "ask", lambda question: questions.append(question) or True)
+    transport, _ = mock_github({"alice", "bob"}, direct={"alice": "read", "bob": "write"})
+    cli._client = httpx.AsyncClient(base_url=cli.GITHUB_API_URL, transport=transport)
+
+    asyncio.run(cli.amain("octocat/hello-world", ["alice", "bob", "carol"], 1, "push", False, 8))
+
+    assert questions == [
+        "Remove and reinvite 2 users and change the permission of 1 user to [bold]push[/bold] "
+        "on [bold]octocat/hello-world[/bold]?"
+    ]
+    output = capsys.readouterr().out
+    assert "2 users have been reinvited" in output
+    assert "1 user now has push permissions" in output
+
+
+def mock_invitations(invitees, fail_page=None):
+    """
+    Serve the given invitee logins from the invitations endpoint, a full page at a time.
+
+    Args:
+        invitees: Logins in listing order, ids counting from 1
+        fail_page: Page number answered with a server error
+
+    Returns:
+        List that collects the page numbers requested
+    """
+    pages = []
+
+    def handler(request):
+        page = int(request.url.params["page"])
+        pages.append(page)
+        if page == fail_page:
+            return httpx.Response(502)
+        size = cli.INVITATIONS_PAGE_SIZE
+        batch = [
+            {"id": index + 1, "invitee": {"login": login}}
+            for index, login in enumerate(invitees)
+        ][(page - 1) * size:page * size]
+        return httpx.Response(200, json=batch)
+
+    cli._client = httpx.AsyncClient(base_url=cli.GITHUB_API_URL, transport=httpx.MockTransport(handler))
+    return pages
+
+
+def filler(count):
+    return [f"someone{index}" for index in range(count)]
+
+
+def test_check_pending_invitation_finds_an_invitee_on_page_three():
+    pages = mock_invitations(filler(2 * cli.INVITATIONS_PAGE_SIZE + 5) + ["Alice"])
+
+    assert asyncio.run(cli.check_pending_invitation("o/r", "alice")) == 2 * cli.INVITATIONS_PAGE_SIZE + 6
+    assert pages == [1, 2, 3]
+
+
+def test_max_pages_stops_early_and_a_later_call_resumes():
+    pages = mock_invitations(filler(cli.INVITATIONS_PAGE_SIZE + 5) + ["alice"])
+
+    async def lookups():
+        first = await cli.check_pending_invitation("o/r", "alice", max_pages=1)
+        return first, await cli.check_pending_invitation("o/r", "alice")
+
+    assert asyncio.run(lookups()) == (0, cli.INVITATIONS_PAGE_SIZE + 6)
+    assert pages == [1, 2]
+
+
+def test_invitation_pending_while_the_listing_is_cut_short():
+    pages = mock_invitations(filler(2 * cli.INVITATIONS_PAGE_SIZE), fail_page=2)
+
+    assert asyncio.run(cli.invitation_pending("o/r", "alice", 0.0)) is True
+    assert pages == [1, 2]
+
+
+@pytest.mark.parametrize("response, present", [
+    (httpx.Response(404), False),
+    (httpx.Response(204), True),
+    (httpx.Response(403), True),
+    (httpx.Response(502), True),
+    (httpx.ReadTimeout("timed out"), True),
+])
+def test_still_collaborator_only_treats_404_as_gone(response, present):
+    def handler(request):
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    cli._client = httpx.AsyncClient(base_url=cli.GITHUB_API_URL, transport=httpx.MockTransport(handler))
+
+    assert asyncio.run(cli.still_collaborator("o/r", "alice")) is present
+
+
+@pytest.mark.parametrize("status, force, expected", [
+    (cli.UserStatus(True, 0, "pull"), False, True),
+    (cli.UserStatus(True, 0, "push"), False, False),
+    (cli.UserStatus(True, 0, "pull"), True, False),
+    (cli.UserStatus(True, 0, None), False, False),
+    (cli.UserStatus(False, 42, None), False, False),
+])
+def test_updates_in_place(status, force, expected):
+    assert cli.updates_in_place(status, "push", force) is expected